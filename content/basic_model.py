@@ -1,3 +1,4 @@
+# cython: language_level=3
 """
 Call Centre Simulation Model
 
@@ -6,6 +7,9 @@ Contains experiment management, distribution classes, and simulation logic.
 
 To be used with 07a_experiments_exercise.ipynb
 
+The module is plain Python. It can optionally be compiled with Cython
+(see setup.py) and the compiled version is then imported in its place.
+
 Author: Tom Monks
 """
 
@@ -13,6 +17,17 @@ import numpy as np
 import pandas as pd
 import simpy
 import itertools
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+from distributions import Exponential, SAMPLE_BUFFER_SIZE, BIT_GENERATOR
+from sim_core import (
+    NUMBA_AVAILABLE,
+    preroll,
+    simulate_presampled,
+    simulate_tile,
+    triangular_icdf,
+)
 
 # =============================================================================
 # CONSTANTS AND DEFAULT VALUES
@@ -39,6 +54,11 @@ TRACE = False
 # Run variables
 RESULTS_COLLECTION_PERIOD = 1000
 
+# Key performance indicators returned by a single run of the model
+RESULTS_DTYPE = np.dtype(
+    [("01_mean_waiting_time", np.float64), ("02_operator_util", np.float64)]
+)
+
 
 # =============================================================================
 # DISTRIBUTION CLASSES
@@ -50,7 +70,21 @@ class Triangular:
     Packages up distribution parameters, seed and random generator.
     """
 
-    def __init__(self, low, mode, high, random_seed=None):
+    __slots__ = (
+        "rand", "bit_generator", "low", "high", "mode", "_bufsize", "_buf",
+        "_idx",
+    )
+
+    def __init__(
+        self,
+        low,
+        mode,
+        high,
+        random_seed=None,
+        buffer_size=SAMPLE_BUFFER_SIZE,
+        bit_generator=BIT_GENERATOR,
+        rng=None,
+    ):
         """
         Constructor. Accepts and stores parameters of the triangular dist
         and a random seed.
@@ -68,16 +102,113 @@ class Triangular:
 
         random_seed: int | SeedSequence, optional (default=None)
             Used with params to create a series of repeatable samples.
+
+        buffer_size: int, optional (default=SAMPLE_BUFFER_SIZE)
+            Number of single samples pre-generated in each call to numpy.
+
+        bit_generator: numpy BitGenerator class, optional
+            (default=BIT_GENERATOR)
+            Used to create the random generator e.g. np.random.SFC64,
+            np.random.PCG64 or np.random.Philox.
+
+        rng: np.random.Generator, optional (default=None)
+            An existing random generator to sample from. If provided,
+            random_seed and bit_generator are ignored.
+        """
+        self.bit_generator = bit_generator
+        if rng is None:
+            rng = np.random.Generator(bit_generator(random_seed))
+        self.rand = rng
+
+        # buffer of pre-generated samples used when a single value is requested
+        # it is filled on first use so that array samples from a new
+        # distribution are the same as the equivalent single samples.
+        self._bufsize = buffer_size
+        self._buf = None
+        self._idx = self._bufsize
+
+        self.set_params(low, mode, high)
+
+    def set_params(self, low, mode, high):
+        """
+        Validate and store the parameters of the distribution. Any buffered
+        samples taken with the previous parameters are discarded.
+
+        Params:
+        ------
+        low: float
+            The smallest values that can be sampled
+
+        mode: float
+            The most frequently sample value
+
+        high: float
+            The highest value that can be sampled
+
+        Raises:
+        ------
+        ValueError
+            Unless low <= mode <= high and low < high. numpy's triangular
+            raises the same error, but the compiled inverse CDF does not
+            check its parameters.
         """
-        self.rand = np.random.default_rng(seed=random_seed)
+        if not (low <= mode <= high and low < high):
+            raise ValueError(
+                "triangular parameters must satisfy low <= mode <= high "
+                f"and low < high (got {low}, {mode}, {high})"
+            )
         self.low = low
-        self.high = high
         self.mode = mode
+        self.high = high
+        self._idx = self._bufsize
+
+    def reseed(self, random_seed=None, rng=None):
+        """
+        Replace the random number generator with a new seed. Any buffered
+        samples from the previous generator are discarded.
+
+        Params:
+        ------
+        random_seed: int | SeedSequence
+            Used with params to create a series of repeatable samples.
+
+        rng: np.random.Generator, optional (default=None)
+            An existing random generator to use instead of a new one.
+        """
+        if rng is None:
+            rng = np.random.Generator(self.bit_generator(random_seed))
+        self.rand = rng
+        self._idx = self._bufsize
+
+    def _triangular(self, size):
+        """
+        Sample size values from the triangular distribution. If numba is
+        available uniforms are transformed by the compiled inverse CDF,
+        which is faster than (and identical to) Generator.triangular.
+        """
+        if NUMBA_AVAILABLE:
+            u = self.rand.random(size)
+            return triangular_icdf(
+                u.ravel(), self.low, self.mode, self.high
+            ).reshape(u.shape)
+        return self.rand.triangular(self.low, self.mode, self.high, size=size)
+
+    def _refill(self):
+        """
+        Fill the sample buffer with a single vectorised call.
+        Samples are stored as python floats so that arithmetic on a single
+        sample does not go through numpy scalar operations.
+        """
+        self._buf = self._triangular(self._bufsize).tolist()
+        self._idx = 0
 
     def sample(self, size=None):
         """
         Generate one or more samples from the triangular distribution
 
+        Single samples are taken from a pre-generated buffer. This avoids the
+        overhead of calling numpy for every event in the simulation.
+
         Params:
         --------
         size: int
@@ -88,46 +219,99 @@ class Triangular:
         -------
         float or np.ndarray (if size >=1)
         """
-        return self.rand.triangular(self.low, self.mode, self.high, size=size)
+        if size is not None:
+            return self._triangular(size)
 
+        return self.sample_one()
 
-class Exponential:
-    """
-    Convenience class for the exponential distribution.
-    Packages up distribution parameters, seed and random generator.
-    """
-
-    def __init__(self, mean, random_seed=None):
+    def sample_one(self):
         """
-        Constructor
+        Generate a single sample from the pre-generated buffer. The same as
+        sample() without checking size: use this in a simulation's hot loop.
 
-        Params:
-        ------
-        mean: float
-            The mean of the exponential distribution
-
-        random_seed: int| SeedSequence, optional (default=None)
-            A random seed to reproduce samples. If set to none then a unique
-            sample is created.
+        Returns:
+        -------
+        float
         """
-        self.rand = np.random.default_rng(seed=random_seed)
-        self.mean = mean
+        if self._idx == self._bufsize:
+            self._refill()
+        value = self._buf[self._idx]
+        self._idx += 1
+        return value
 
-    def sample(self, size=None):
+    def sample_many(self, n):
         """
-        Generate a sample from the exponential distribution
+        Generate an array of n samples in a single vectorised call. Use this
+        rather than repeated calls to sample() when many values are needed.
 
         Params:
         -------
-        size: int, optional (default=None)
-            the number of samples to return. If size=None then a single
-            sample is returned.
+        n: int
+            the number of samples to return.
 
         Returns:
         -------
-        float or np.ndarray (if size >=1)
+        np.ndarray
+        """
+        return self.sample(size=n)
+
+
+class VariateTile:
+    """
+    A fixed size block (tile) of call arrival times and call durations.
+
+    Each refill draws uniforms from the experiment's arrival and call
+    streams and transforms them with the fused sim_core.preroll kernel.
+    Simulating a run one tile at a time keeps the number of samples held
+    in memory at the tile size regardless of the run length.
+    """
+
+    __slots__ = (
+        "arrival_rng", "call_rng", "mean_iat", "low", "mode", "high",
+        "size", "arrival_times", "call_durations", "last_arrival",
+    )
+
+    def __init__(self, experiment, size=SAMPLE_BUFFER_SIZE):
+        """
+        Constructor
+
+        Params:
+        ------
+        experiment: Experiment
+            Provides the random number streams and distribution parameters
+
+        size: int, optional (default=SAMPLE_BUFFER_SIZE)
+            Number of calls sampled in each tile
+        """
+        self.arrival_rng = experiment.generators[0]
+        self.call_rng = experiment.generators[1]
+        self.mean_iat = experiment.mean_iat
+        self.low = experiment.call_low
+        self.mode = experiment.call_mode
+        self.high = experiment.call_high
+        self.size = size
+
+        # the tile is empty until refill is called. Arrival times continue
+        # from the last arrival in the previous tile.
+        self.arrival_times = None
+        self.call_durations = None
+        self.last_arrival = 0.0
+
+    def refill(self):
         """
-        return self.rand.exponential(self.mean, size=size)
+        Replace the tile with the next block of arrival times and call
+        durations.
+        """
+        inter_arrival_times, self.call_durations = preroll(
+            self.arrival_rng.random(self.size),
+            self.call_rng.random(self.size),
+            self.mean_iat,
+            self.low,
+            self.mode,
+            self.high,
+        )
+        self.arrival_times = self.last_arrival + np.cumsum(inter_arrival_times)
+        self.last_arrival = self.arrival_times[-1]
 
 
 # =============================================================================
@@ -145,22 +329,45 @@ class Experiment:
     3. Controls the set & streams of psuedo random numbers used in a run.
     """
 
+    __slots__ = (
+        "random_number_set", "n_streams", "bit_generator", "n_operators",
+        "mean_iat", "call_low", "call_mode", "call_high", "use_numba",
+        "vectorised", "callers", "results", "seeds", "generators",
+        "arrival_dist", "call_dist", "_wt_n", "_total_call",
+    )
+
     def __init__(
         self,
-        random_number_set=DEFAULT_RND_SET,
-        n_operators=N_OPERATORS,
-        mean_iat=MEAN_IAT,
-        call_low=CALL_LOW,
-        call_mode=CALL_MODE,
-        call_high=CALL_HIGH,
-        n_streams=N_STREAMS,
-    ):
+        random_number_set: int = DEFAULT_RND_SET,
+        n_operators: int = N_OPERATORS,
+        mean_iat: float = MEAN_IAT,
+        call_low: float = CALL_LOW,
+        call_mode: float = CALL_MODE,
+        call_high: float = CALL_HIGH,
+        n_streams: int = N_STREAMS,
+        bit_generator=BIT_GENERATOR,
+        use_numba: bool = False,
+        vectorised: bool = False,
+    ) -> None:
         """
         The init method sets up our defaults.
+
+        bit_generator is the numpy BitGenerator class used by each stream
+        e.g. np.random.Philox for counter based streams.
+
+        If use_numba=True and numba is installed, single_run uses the
+        compiled sampling and event loop in sim_core rather than SimPy.
+        Samples are taken by inversion from the experiment's random number
+        streams so results differ from the SimPy model.
+
+        If vectorised=True, single_run samples all arrivals and call
+        durations up front from the experiment's distributions and
+        simulates them without SimPy. Results match the SimPy model.
         """
         # sampling
         self.random_number_set = random_number_set
         self.n_streams = n_streams
+        self.bit_generator = bit_generator
         
         # store parameters for the run of the model
         self.n_operators = n_operators
@@ -168,18 +375,44 @@ class Experiment:
         self.call_low = call_low
         self.call_mode = call_mode
         self.call_high = call_high
+
+        # use the compiled simulation core (if numba is available)
+        self.use_numba = use_numba
+
+        # simulate from pre-sampled arrays rather than with SimPy
+        self.vectorised = vectorised
         
-        # resources: we must init resources after an Environment is created.
-        # But we will store a placeholder for transparency
-        self.operators = None
+        # queue of callers waiting for an operator: we must init this after
+        # an Environment is created. But we will store a placeholder for
+        # transparency
+        self.callers = None
+
+        # initialise sampling objects. These validate the distribution
+        # parameters before they are used to size the results arrays.
+        self.init_sampling()
 
         # initialise results to zero
+        self.results = {}
         self.init_results_variables()
 
-        # initialise sampling objects
-        self.init_sampling()
+    def __getstate__(self) -> dict:
+        """
+        Support pickling of an experiment so that replications can be run
+        in separate processes. The callers queue holds a reference to a
+        simpy Environment and is recreated by each run, so it is not copied.
+        """
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state["callers"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """
+        Restore an experiment pickled with __getstate__.
+        """
+        for name, value in state.items():
+            setattr(self, name, value)
 
-    def set_random_no_set(self, random_number_set):
+    def set_random_no_set(self, random_number_set: int) -> None:
         """
         Controls the random sampling
         Parameters:
@@ -189,22 +422,105 @@ class Experiment:
             the distributions in the simulation.
         """
         self.random_number_set = random_number_set
-        self.init_sampling()
 
-    def init_sampling(self):
+        # reseed the existing distributions rather than create new ones.
+        self.set_seeds(
+            np.random.SeedSequence(random_number_set).spawn(self.n_streams)
+        )
+
+    def set_seeds(self, seeds) -> None:
+        """
+        Reseed the distributions from a list of SeedSequences (one per
+        stream). Distribution parameters are also refreshed from the
+        experiment so that changes (e.g. to mean_iat) take effect.
+
+        Parameters:
+        ----------
+        seeds: list
+            n_streams SeedSequences e.g. spawned from a parent SeedSequence
+        """
+        self.seeds = seeds
+        self.generators = self._create_generators(seeds)
+
+        self.arrival_dist.set_mean(self.mean_iat)
+        self.arrival_dist.reseed(rng=self.generators[0])
+
+        self.call_dist.set_params(
+            self.call_low, self.call_mode, self.call_high
+        )
+        self.call_dist.reseed(rng=self.generators[1])
+
+    def _create_generators(self, seeds) -> list:
+        """
+        Create one random generator per stream. Distributions that sample
+        from the same stream share its generator.
+        """
+        return [np.random.Generator(self.bit_generator(s)) for s in seeds]
+
+    def spawn_replications(self, n_reps: int) -> list:
+        """
+        Create one copy of the experiment per replication, each with its
+        own independent random number streams.
+
+        Streams are allocated by blocking: the experiment's SeedSequence
+        spawns a child per replication and each child spawns n_streams
+        grandchildren. Every replication therefore uses a separate, non
+        overlapping block of random numbers. The alternative, leap-frog,
+        interleaves one stream between replications and needs a generator
+        that can jump ahead, which numpy's SeedSequence does not provide.
+
+        The copies can be run with single_run(copy, rep=None) in any order
+        or in separate processes and give the same results.
+
+        Parameters:
+        ----------
+        n_reps: int
+            Number of replications
+
+        Returns:
+        --------
+        list: n_reps Experiment objects
+        """
+        seed_sequence = np.random.SeedSequence(self.random_number_set)
+
+        experiments = []
+        for rep_seed in seed_sequence.spawn(n_reps):
+            experiment = Experiment(
+                random_number_set=self.random_number_set,
+                n_operators=self.n_operators,
+                mean_iat=self.mean_iat,
+                call_low=self.call_low,
+                call_mode=self.call_mode,
+                call_high=self.call_high,
+                n_streams=self.n_streams,
+                bit_generator=self.bit_generator,
+                use_numba=self.use_numba,
+                vectorised=self.vectorised,
+            )
+            experiment.set_seeds(rep_seed.spawn(self.n_streams))
+            experiments.append(experiment)
+        return experiments
+
+    def init_sampling(self) -> None:
         """
         Create the distributions used by the model and initialise
         the random seeds of each.
+
+        Distributions are created once. set_random_no_set reseeds them
+        and refreshes their parameters from the experiment.
         """
         # produce n non-overlapping streams
         seed_sequence = np.random.SeedSequence(self.random_number_set)
         self.seeds = seed_sequence.spawn(self.n_streams)
+        self.generators = self._create_generators(self.seeds)
 
         # create distributions
 
         # call inter-arrival times
         self.arrival_dist = Exponential(
-            self.mean_iat, random_seed=self.seeds[0]
+            self.mean_iat,
+            bit_generator=self.bit_generator,
+            rng=self.generators[0],
         )
 
         # duration of call triage
@@ -212,57 +528,104 @@ class Experiment:
             self.call_low,
             self.call_mode,
             self.call_high,
-            random_seed=self.seeds[1],
+            bit_generator=self.bit_generator,
+            rng=self.generators[1],
         )
 
-    def init_results_variables(self):
+    def init_results_variables(
+        self, rc_period: float = RESULTS_COLLECTION_PERIOD
+    ) -> None:
         """
         Initialise all of the experiment variables used in results
         collection. This method is called at the start of each run
         of the model
-        """
-        # variable used to store results of experiment
-        self.results = {}
-        self.results["waiting_times"] = []
 
-        # total operator usage time for utilisation calculation.
+        Parameters:
+        ----------
+        rc_period: float, optional (default=RESULTS_COLLECTION_PERIOD)
+            Run length. Used to size the waiting times array.
+        """
+        # variable used to store results of experiment. It is cleared in
+        # place between runs rather than recreated.
+        self.results.clear()
+
+        # waiting times are written into a preallocated array sized from
+        # the expected number of arrivals. It is doubled in size if exceeded.
+        # A new array is used for each run so that waiting times from an
+        # earlier run are not overwritten.
+        capacity = int(rc_period / self.mean_iat * 2) + 64
+        self.results["waiting_times"] = np.empty(capacity, dtype=np.float64)
+
+        # count of waiting times recorded. Only the first _wt_n values of
+        # the waiting times array are valid.
+        self._wt_n = 0
+
+        # total operator usage time for utilisation calculation. Updated
+        # as an attribute during a run and copied into results at the end.
+        self._total_call = 0.0
         self.results["total_call_duration"] = 0.0
 
+    def get_waiting_times(self) -> np.ndarray:
+        """
+        Return the waiting times recorded in the last run of the model.
+
+        Returns:
+        --------
+        np.ndarray: a view of the recorded values in the waiting times array
+        """
+        return self.results["waiting_times"][: self._wt_n]
+
 
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
 
-def trace(msg):
+def _print_trace(msg):
     """
-    Turning printing of events on and off.
+    Print events to screen when tracing is on.
 
     Params:
     -------
     msg: str
         string to print to screen.
     """
-    if TRACE:
-        print(msg)
+    print(msg)
+
+
+def _no_trace(msg):
+    """
+    Ignore events when tracing is off.
+
+    Params:
+    -------
+    msg: str
+        string that is not printed.
+    """
+
+
+# Turning printing of events on and off. trace is rebound by set_trace so
+# that no check of TRACE is needed when it is called. Model processes copy
+# TRACE and trace into locals when they start and skip building messages
+# when tracing is off.
+trace = _print_trace if TRACE else _no_trace
 
 
 # =============================================================================
 # MODEL LOGIC
 # =============================================================================
 
-def service(identifier, env, args):
+def operator_process(env: simpy.Environment, args: "Experiment"):
     """
-    Simulates the service process for a call operator
+    Simulates a call operator. Each operator is a single long running
+    process that repeatedly answers the next call in the queue. This
+    avoids creating a new process for every call.
 
-    1. request and wait for a call operator
+    1. wait for the next caller in the queue (FIFO)
     2. phone triage (triangular)
-    3. exit system
+    3. caller exits system
 
     Params:
     ------
-    identifier: int
-        A unique identifer for this caller
-
     env: simpy.Environment
         The current environent the simulation is running in
         We use this to pause and restart the process after a delay.
@@ -271,38 +634,56 @@ def service(identifier, env, args):
         The settings and input parameters for the current experiment
     """
 
-    # record the time that call entered the queue
-    start_wait = env.now
+    # local names for objects used repeatedly in this function.
+    # Note the waiting times array is not cached: it may be resized by
+    # another operator.
+    results = args.results
+    call_sample = args.call_dist.sample_one
+    get_caller = args.callers.get
+    timeout = env.timeout
+
+    # tracing is fixed for the run (set_trace applies from the next run)
+    tracing = TRACE
+    log = trace
 
-    # request an operator - stored in the Experiment
-    with args.operators.request() as req:
-        yield req
+    while True:
+        # wait for a caller: (unique identifier, time call entered queue)
+        identifier, start_wait = yield get_caller()
 
         # record the waiting time for call to be answered
-        waiting_time = env.now - start_wait
+        now = env.now
+        waiting_time = now - start_wait
 
         # store the results for an experiment
-        args.results["waiting_times"].append(waiting_time)
+        i = args._wt_n
+        buf = results["waiting_times"]
+        if i == buf.size:
+            buf = np.resize(buf, buf.size * 2)
+            results["waiting_times"] = buf
+        buf[i] = waiting_time
+        args._wt_n = i + 1
 
-        trace(f"operator answered call {identifier} at {env.now:.3f}")
+        if tracing:
+            log(f"operator answered call {identifier} at {now:.3f}")
 
         # the sample distribution is defined by the experiment
-        call_duration = args.call_dist.sample()
+        call_duration = call_sample()
 
         # schedule process to begin again after call_duration
-        yield env.timeout(call_duration)
+        yield timeout(call_duration)
 
         # update the total call_duration
-        args.results["total_call_duration"] += call_duration
+        args._total_call += call_duration
 
         # print out information for patient.
-        trace(
-            f"call {identifier} ended {env.now:.3f}; "
-            + f"waiting time was {waiting_time:.3f}"
-        )
+        if tracing:
+            log(
+                f"call {identifier} ended {env.now:.3f}; "
+                + f"waiting time was {waiting_time:.3f}"
+            )
 
 
-def arrivals_generator(env, args):
+def arrivals_generator(env: simpy.Environment, args: "Experiment"):
     """
     IAT is exponentially distributed
 
@@ -314,26 +695,128 @@ def arrivals_generator(env, args):
     args: Experiment
         The settings and input parameters for the simulation.
     """
+    # local names for methods called on every arrival
+    timeout = env.timeout
+    put_caller = args.callers.put
+    arrival_sample = args.arrival_dist.sample_one
+
+    # tracing is fixed for the run (set_trace applies from the next run)
+    tracing = TRACE
+    log = trace
+
     # use itertools as it provides an infinite loop
-    # with a counter variable that we can use for unique Ids
+    # with a counter variable that we can use for unique Ids.
     for caller_count in itertools.count(start=1):
 
-        # the sample distribution is defined by the experiment
-        inter_arrival_time = args.arrival_dist.sample()
-
-        yield env.timeout(inter_arrival_time)
+        # sample inter-arrival time.
+        inter_arrival_time = arrival_sample()
+        yield timeout(inter_arrival_time)
 
-        trace(f"call arrives at: {env.now:.3f}")
+        if tracing:
+            log(f"call arrives at: {env.now:.3f}")
 
-        # we pass the experiment to the service function
-        env.process(service(caller_count, env, args))
+        # the caller joins the queue for an operator
+        put_caller((caller_count, env.now))
 
 
 # =============================================================================
 # EXPERIMENT EXECUTION FUNCTIONS
 # =============================================================================
 
-def single_run(experiment, rep=0, rc_period=RESULTS_COLLECTION_PERIOD):
+def _sample_arrival_times(experiment, rc_period):
+    """
+    Sample the arrival times of all calls that arrive before rc_period.
+
+    Params:
+    -------
+    experiment: Experiment
+        The experiment/paramaters to use with model
+
+    rc_period: float
+        Results collection period - how long to run the simulation
+
+    Returns:
+    --------
+    np.ndarray: ascending arrival times
+    """
+    # sample the expected number of arrivals with a margin and top up
+    # in the (unlikely) case that the run length has not been reached.
+    n_expected = int(rc_period / experiment.mean_iat * 1.5) + 64
+    arrival_times = np.cumsum(experiment.arrival_dist.sample_many(n_expected))
+    while arrival_times[-1] < rc_period:
+        extra = np.cumsum(experiment.arrival_dist.sample_many(n_expected))
+        arrival_times = np.concatenate([arrival_times, arrival_times[-1] + extra])
+
+    return arrival_times[arrival_times < rc_period]
+
+
+def _run_tiled(experiment, rc_period, tile_size=SAMPLE_BUFFER_SIZE):
+    """
+    Simulate a run with the compiled event loop, sampling and simulating
+    calls one VariateTile at a time. Results are stored in the experiment
+    as the SimPy model does.
+
+    Params:
+    -------
+    experiment: Experiment
+        The experiment/paramaters to use with model
+
+    rc_period: float
+        Results collection period - how long to run the simulation
+
+    tile_size: int, optional (default=SAMPLE_BUFFER_SIZE)
+        Number of calls sampled in each tile
+    """
+    tile = VariateTile(experiment, tile_size)
+
+    # operator free times are carried from one tile to the next
+    free_at = np.zeros(experiment.n_operators)
+
+    waiting_times = experiment.results["waiting_times"]
+    n_waits = 0
+    total_call_duration = 0.0
+
+    finished = False
+    while not finished:
+        tile.refill()
+        tile_waits, tile_call_duration, finished = simulate_tile(
+            tile.arrival_times, tile.call_durations, free_at, rc_period
+        )
+
+        end = n_waits + tile_waits.size
+        if end > waiting_times.size:
+            waiting_times = np.resize(waiting_times, end * 2)
+        waiting_times[n_waits:end] = tile_waits
+        n_waits = end
+        total_call_duration += tile_call_duration
+
+    experiment.results["waiting_times"] = waiting_times
+    experiment._wt_n = n_waits
+    experiment._total_call = total_call_duration
+
+
+def _run_presampled(experiment, arrival_times, call_durations, rc_period):
+    """
+    Simulate a run from pre-sampled arrival times and call durations and
+    store the results in the experiment as the SimPy model does.
+    """
+    waiting_times, total_call_duration = simulate_presampled(
+        arrival_times,
+        call_durations,
+        experiment.n_operators,
+        rc_period,
+    )
+    experiment.results["waiting_times"] = waiting_times
+    experiment._wt_n = waiting_times.size
+    experiment._total_call = total_call_duration
+
+
+def single_run(
+    experiment: Experiment,
+    rep: int = 0,
+    rc_period: float = RESULTS_COLLECTION_PERIOD,
+    out_row=None,
+):
     """
     Perform a single run of the model and return the results
 
@@ -343,40 +826,73 @@ def single_run(experiment, rep=0, rc_period=RESULTS_COLLECTION_PERIOD):
         The experiment/paramaters to use with model
     
     rep: int, optional (default=0)
-        The replication number for random seed control
+        The replication number for random seed control. If None the
+        experiment's current random number streams (e.g. those set by
+        Experiment.spawn_replications) are restarted and used.
         
     rc_period: float, optional (default=RESULTS_COLLECTION_PERIOD)
         Results collection period - how long to run the simulation
 
+    out_row: np.void, optional (default=None)
+        A row of a structured array with RESULTS_DTYPE. If provided the
+        KPIs are written directly into the row instead of a new dict.
+
     Returns:
     --------
     dict: Dictionary containing the key performance indicators
+        (or out_row if provided)
     """
 
     # results dictionary. Each KPI is a new entry.
-    run_results = {}
-
-    # reset all result collection variables
-    experiment.init_results_variables()
+    run_results = {} if out_row is None else out_row
 
     # set random number set to the replication no.
-    # this controls sampling for the run.
-    experiment.set_random_no_set(rep)
-
-    # environment is (re)created inside single run
-    env = simpy.Environment()
+    # this controls sampling for the run. Without a replication number
+    # the experiment's current streams are restarted from their seeds.
+    if rep is not None:
+        experiment.set_random_no_set(rep)
+    else:
+        experiment.set_seeds(experiment.seeds)
 
-    # we create simpy resource here - this has to be after we
-    # create the environment object.
-    experiment.operators = simpy.Resource(env, capacity=experiment.n_operators)
-
-    # we pass the experiment to the arrivals generator
-    env.process(arrivals_generator(env, experiment))
-    env.run(until=rc_period)
-
-    # end of run results: calculate mean waiting time
-    run_results["01_mean_waiting_time"] = np.mean(
-        experiment.results["waiting_times"]
+    # reset all result collection variables
+    experiment.init_results_variables(rc_period)
+
+    if experiment.use_numba and NUMBA_AVAILABLE:
+        # compiled sampling and event loop: bypasses SimPy entirely.
+        _run_tiled(experiment, rc_period)
+    elif experiment.vectorised:
+        # pre-sampled arrays: bypasses SimPy, but uses the same samples.
+        arrival_times = _sample_arrival_times(experiment, rc_period)
+        _run_presampled(
+            experiment,
+            arrival_times,
+            experiment.call_dist.sample_many(arrival_times.size),
+            rc_period,
+        )
+    else:
+        # environment is (re)created inside single run
+        env = simpy.Environment()
+
+        # we create the queue of callers here - this has to be after we
+        # create the environment object.
+        experiment.callers = simpy.Store(env)
+
+        # one long running process per operator
+        for _ in range(experiment.n_operators):
+            env.process(operator_process(env, experiment))
+
+        # we pass the experiment to the arrivals generator
+        env.process(arrivals_generator(env, experiment))
+        env.run(until=rc_period)
+
+    # copy the run's accumulators into the results
+    experiment.results["total_call_duration"] = experiment._total_call
+
+    # end of run results: calculate mean waiting time. The mean is taken
+    # over the recorded array (numpy uses pairwise summation).
+    waiting_times = experiment.get_waiting_times()
+    run_results["01_mean_waiting_time"] = (
+        waiting_times.mean() if waiting_times.size > 0 else np.nan
     )
 
     # end of run results: calculate mean operator utilisation
@@ -389,8 +905,70 @@ def single_run(experiment, rep=0, rc_period=RESULTS_COLLECTION_PERIOD):
     return run_results
 
 
+def _run_one(run_args):
+    """
+    Unpack a tuple of (experiment, rep, rc_period) and perform a single run.
+    Defined at module level so that it can be pickled and sent to a worker
+    process.
+    """
+    experiment, rep, rc_period = run_args
+    return single_run(experiment, rep, rc_period)
+
+
+def _run_all(run_args, n_jobs=1):
+    """
+    Perform a single run for each (experiment, rep, rc_period) tuple.
+
+    Params:
+    -------
+    run_args: list
+        List of (experiment, rep, rc_period) tuples.
+
+    n_jobs: int, optional (default=1)
+        Number of processes to use. 1 runs in the current process;
+        -1 uses all available cores.
+
+    Returns:
+    --------
+    list: results dictionaries in the same order as run_args.
+    """
+    if n_jobs == 1:
+        return [_run_one(args) for args in run_args]
+
+    max_workers = None if n_jobs == -1 else n_jobs
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_run_one, run_args))
+
+
+def _results_to_arrays(results):
+    """
+    Convert a list of results dictionaries from single_run into a dict of
+    numpy arrays (one per KPI) without the overhead of a DataFrame.
+
+    Params:
+    -------
+    results: list
+        Results dictionaries from single_run
+
+    Returns:
+    --------
+    dict: KPI name -> np.ndarray of results from each run
+    """
+    return {
+        key: np.fromiter(
+            (r[key] for r in results), dtype=np.float64, count=len(results)
+        )
+        for key in results[0]
+    }
+
+
 def multiple_replications(
-    experiment, rc_period=RESULTS_COLLECTION_PERIOD, n_reps=5
+    experiment,
+    rc_period=RESULTS_COLLECTION_PERIOD,
+    n_reps=5,
+    n_jobs=1,
+    as_frame=True,
+    spawn_seeds=False,
 ):
     """
     Perform multiple replications of the model.
@@ -407,20 +985,56 @@ def multiple_replications(
     n_reps: int, optional (default=5)
         Number of independent replications to run.
 
+    n_jobs: int, optional (default=1)
+        Number of processes used to run replications in parallel.
+        -1 uses all available cores. Multiple processes are not available
+        when running in the browser (JupyterLite).
+
+    as_frame: bool, optional (default=True)
+        If False, return a dict of numpy arrays rather than a DataFrame.
+        Useful when only aggregate results are needed.
+
+    spawn_seeds: bool, optional (default=False)
+        If True, each replication is run on a copy of the experiment with
+        streams spawned from the experiment's random_number_set (see
+        Experiment.spawn_replications) rather than seeded by its
+        replication number.
+
     Returns:
     --------
-    pandas.DataFrame
+    pandas.DataFrame or dict
         DataFrame containing results from all replications
     """
 
-    # loop over single run to generate results dicts in a python list.
-    results = [single_run(experiment, rep, rc_period) for rep in range(n_reps)]
+    # each replication writes its results into a row of a preallocated
+    # structured array.
+    results = np.zeros(n_reps, dtype=RESULTS_DTYPE)
+
+    if spawn_seeds:
+        run_args = [
+            (rep_experiment, None, rc_period)
+            for rep_experiment in experiment.spawn_replications(n_reps)
+        ]
+    else:
+        run_args = [(experiment, rep, rc_period) for rep in range(n_reps)]
+
+    if n_jobs == 1:
+        for rep, (rep_experiment, rep_no, _) in enumerate(run_args):
+            single_run(rep_experiment, rep_no, rc_period, out_row=results[rep])
+    else:
+        # rows cannot be shared with worker processes: copy results back.
+        run_results = _run_all(run_args, n_jobs)
+        for rep, run_result in enumerate(run_results):
+            for key in RESULTS_DTYPE.names:
+                results[rep][key] = run_result[key]
+
+    if not as_frame:
+        return {key: results[key] for key in RESULTS_DTYPE.names}
 
     # format and return results in a dataframe
-    df_results = pd.DataFrame(results)
-    df_results.index = np.arange(1, len(df_results) + 1)
-    df_results.index.name = "rep"
-    return df_results
+    return pd.DataFrame(
+        results, index=pd.RangeIndex(1, n_reps + 1, name="rep")
+    )
 
 
 # =============================================================================
@@ -439,8 +1053,9 @@ def set_trace(trace_on=True):
     trace_on: bool, optional (default=True)
         Whether to turn tracing on or off
     """
-    global TRACE
+    global TRACE, trace
     TRACE = trace_on
+    trace = _print_trace if trace_on else _no_trace
 
 
 def summary_stats(results_df):
@@ -456,12 +1071,40 @@ def summary_stats(results_df):
     --------
     pandas.DataFrame: Summary statistics (mean, std, min, max)
     """
-    return results_df.describe()
+    values = results_df.to_numpy(dtype=np.float64)
+
+    # a single replication or an all NaN column gives NaN statistics
+    # (as DataFrame.describe() did) rather than a RuntimeWarning.
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        stats = [
+            np.nanmean(values, axis=0),
+            np.nanstd(values, axis=0, ddof=1),
+            np.nanmin(values, axis=0),
+            np.nanmax(values, axis=0),
+        ]
+
+    return pd.DataFrame(
+        stats,
+        index=["mean", "std", "min", "max"],
+        columns=results_df.columns,
+    )
 
 
-def compare_experiments(experiments_dict, n_reps=10, rc_period=RESULTS_COLLECTION_PERIOD):
+def compare_experiments(
+    experiments_dict,
+    n_reps=10,
+    rc_period=RESULTS_COLLECTION_PERIOD,
+    n_jobs=1,
+    common_random_numbers=True,
+):
     """
     Compare multiple experiments and return summary results
+
+    By default the experiments use common random numbers (CRN): replication
+    i of every experiment uses the same random number set, and each activity
+    has its own stream. Differences between experiments then have a lower
+    variance, so fewer replications are needed for the same precision.
     
     Params:
     -------
@@ -471,16 +1114,40 @@ def compare_experiments(experiments_dict, n_reps=10, rc_period=RESULTS_COLLECTIO
         Number of replications for each experiment
     rc_period: float, optional (default=RESULTS_COLLECTION_PERIOD)
         Results collection period
+    n_jobs: int, optional (default=1)
+        Number of processes used to run all replications of all
+        experiments in parallel. -1 uses all available cores.
+    common_random_numbers: bool, optional (default=True)
+        If False, every experiment uses a different set of random numbers
+        (e.g. to demonstrate the effect of CRN).
         
     Returns:
     --------
     pandas.DataFrame: Comparison of mean results across experiments
     """
+    # a single flat list of runs so that every replication of every
+    # experiment can be shared across the worker processes.
+    # with CRN the random number sets are the same for all experiments.
+    run_args = [
+        (
+            experiment,
+            rep if common_random_numbers else i * n_reps + rep,
+            rc_period,
+        )
+        for i, experiment in enumerate(experiments_dict.values())
+        for rep in range(n_reps)
+    ]
+    results = _run_all(run_args, n_jobs)
+
     comparison_results = {}
     
-    for name, experiment in experiments_dict.items():
-        results = multiple_replications(experiment, rc_period, n_reps)
-        comparison_results[name] = results.mean()
+    for i, name in enumerate(experiments_dict):
+        exp_results = _results_to_arrays(results[i * n_reps:(i + 1) * n_reps])
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            comparison_results[name] = {
+                key: np.nanmean(values) for key, values in exp_results.items()
+            }
     
     return pd.DataFrame(comparison_results).T
 
@@ -506,23 +1173,27 @@ def create_summary_table(results_dict, label_key, label_order):
     pandas.DataFrame
         Summary table with mean and std for waiting time and utilization.
     """
-    summary_data = {
-        label_key: [],
-        'Mean_Waiting_Time': [],
-        'Std_Waiting_Time': [],
-        'Mean_Utilization': [],
-        'Std_Utilization': []
-    }
-
-    for label in label_order:
-        df = results_dict[label]
-        summary_data[label_key].append(label)
-        summary_data['Mean_Waiting_Time'].append(df['01_mean_waiting_time'].mean())
-        summary_data['Std_Waiting_Time'].append(df['01_mean_waiting_time'].std())
-        summary_data['Mean_Utilization'].append(df['02_operator_util'].mean())
-        summary_data['Std_Utilization'].append(df['02_operator_util'].std())
-
-    return pd.DataFrame(summary_data)
+    n_labels = len(label_order)
+    means = np.empty((n_labels, 2))
+    stds = np.empty((n_labels, 2))
+
+    for i, label in enumerate(label_order):
+        vals = results_dict[label][
+            ['01_mean_waiting_time', '02_operator_util']
+        ].to_numpy(dtype=np.float64)
+        # NaN rather than a RuntimeWarning for a single replication
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            means[i] = np.nanmean(vals, axis=0)
+            stds[i] = np.nanstd(vals, axis=0, ddof=1)
+
+    return pd.DataFrame({
+        label_key: list(label_order),
+        'Mean_Waiting_Time': means[:, 0],
+        'Std_Waiting_Time': stds[:, 0],
+        'Mean_Utilization': means[:, 1],
+        'Std_Utilization': stds[:, 1]
+    })
 
 
 
@@ -534,14 +1205,15 @@ __version__ = "1.0.0"
 __author__ = "Tom Monks"
 __all__ = [
     # Classes
-    'Experiment', 'Triangular', 'Exponential',
+    'Experiment', 'Triangular', 'Exponential', 'VariateTile',
     # Main functions
     'single_run', 'multiple_replications',
     # Model functions
-    'service', 'arrivals_generator',
+    'operator_process', 'arrivals_generator',
     # Utility functions
     'trace', 'set_trace', 'summary_stats', 'compare_experiments', "create_summary_table",
     # Constants
     'N_OPERATORS', 'MEAN_IAT', 'CALL_LOW', 'CALL_MODE', 'CALL_HIGH',
-    'RESULTS_COLLECTION_PERIOD', 'TRACE'
+    'RESULTS_COLLECTION_PERIOD', 'RESULTS_DTYPE', 'SAMPLE_BUFFER_SIZE', 'BIT_GENERATOR',
+    'TRACE'
 ]
@@ -8,6 +8,15 @@ from numpy.random import SeedSequence
 from numpy.typing import NDArray, ArrayLike
 import math
 
+# Number of samples pre-generated by a distribution in a single call to numpy
+SAMPLE_BUFFER_SIZE = 4096
+
+# Default bit generator. PCG64 gives the same streams as
+# np.random.default_rng (used in the notebooks). Pass np.random.SFC64 (the
+# fastest of numpy's bit generators) or np.random.Philox (counter based
+# streams) as bit_generator to opt in to a different generator.
+BIT_GENERATOR = np.random.PCG64
+
 class Lognormal:
     """
     Lognormal distribution implementation.
@@ -20,11 +29,18 @@ class Lognormal:
     https://github.com/TomMonks/sim-tools
     """
 
+    __slots__ = (
+        "rng", "mu", "sigma", "mean", "stdev", "_bufsize", "_z", "_zi",
+    )
+
     def __init__(
         self,
         mean: float,
         stdev: float,
         random_seed: Optional[Union[int, SeedSequence]] = None,
+        buffer_size: int = SAMPLE_BUFFER_SIZE,
+        bit_generator: Any = BIT_GENERATOR,
+        rng: Optional[np.random.Generator] = None,
     ):
         """
         Initialize a lognormal distribution.
@@ -40,35 +56,166 @@ class Lognormal:
         random_seed : Optional[Union[int, SeedSequence]], default=None
             A random seed or SeedSequence to reproduce samples. If None, a
             unique sample sequence is generated.
+
+        buffer_size : int, default=SAMPLE_BUFFER_SIZE
+            Number of standard normal samples pre-generated in each call to
+            numpy for single samples.
+
+        bit_generator : Any, default=BIT_GENERATOR
+            numpy BitGenerator class used to create the random generator
+            e.g. np.random.SFC64, np.random.PCG64 or np.random.Philox.
+
+        rng : Optional[np.random.Generator], default=None
+            An existing random generator to sample from e.g. one shared
+            with other distributions of the same stream. If provided,
+            random_seed and bit_generator are ignored.
         """
-        self.rng = np.random.default_rng(random_seed)
+        if rng is None:
+            rng = np.random.Generator(bit_generator(random_seed))
+        self.rng = rng
         mu, sigma = self.normal_moments_from_lognormal(mean, stdev**2)
         self.mu = mu
         self.sigma = sigma
         self.mean = mean
         self.stdev = stdev
 
+        # buffer of standard normal samples used when a single value is
+        # requested. Filled on first use.
+        self._bufsize = buffer_size
+        self._z = None
+        self._zi = self._bufsize
+
     def __repr__(self):
         return f"Lognormal(mean={self.mean}, stdev={self.stdev})"
 
+    @classmethod
+    def from_arrays(
+        cls,
+        means: ArrayLike,
+        stdevs: ArrayLike,
+        random_seed: Optional[Union[int, SeedSequence]] = None,
+        bit_generator: Any = BIT_GENERATOR,
+    ) -> "Lognormal":
+        """
+        Create a batch of lognormal distributions that share one random
+        number generator.
+
+        Sampling the batch draws from every distribution in a single call
+        to numpy. This is much faster than constructing and sampling many
+        Lognormal objects e.g. in a parameter sweep.
+
+        Parameters
+        ----------
+        means : ArrayLike
+            Means of the lognormal distributions.
+
+        stdevs : ArrayLike
+            Standard deviations of the lognormal distributions. Must be of
+            equal length to means.
+
+        random_seed : Optional[Union[int, SeedSequence]], default=None
+            A random seed or SeedSequence to reproduce samples. If None, a
+            unique sample sequence is generated.
+
+        bit_generator : Any, default=BIT_GENERATOR
+            numpy BitGenerator class used to create the random generator.
+
+        Returns
+        -------
+        Lognormal
+            A Lognormal whose sample(size) returns an array of shape
+            (len(means), size).
+
+        Raises
+        ------
+        ValueError
+            If means and stdevs have different lengths.
+        """
+        means = np.asarray(means, dtype=np.float64)
+        stdevs = np.asarray(stdevs, dtype=np.float64)
+
+        if means.shape != stdevs.shape or means.ndim != 1:
+            raise ValueError(
+                "means and stdevs arguments must be 1-D and of equal length"
+            )
+
+        return cls(
+            means, stdevs, random_seed=random_seed, bit_generator=bit_generator
+        )
+
+    @classmethod
+    def from_normal_moments(
+        cls,
+        mu: ArrayLike,
+        sigma: ArrayLike,
+        random_seed: Optional[Union[int, SeedSequence]] = None,
+        bit_generator: Any = BIT_GENERATOR,
+    ) -> "Lognormal":
+        """
+        Create a lognormal distribution from the mean (mu) and standard
+        deviation (sigma) of the underlying normal distribution.
+
+        Parameters
+        ----------
+        mu : ArrayLike
+            Mean of the underlying normal distribution. Pass a 1-D array
+            (with sigma of equal length) to create a batch as from_arrays.
+
+        sigma : ArrayLike
+            Standard deviation of the underlying normal distribution.
+
+        random_seed : Optional[Union[int, SeedSequence]], default=None
+            A random seed or SeedSequence to reproduce samples. If None, a
+            unique sample sequence is generated.
+
+        bit_generator : Any, default=BIT_GENERATOR
+            numpy BitGenerator class used to create the random generator.
+
+        Returns
+        -------
+        Lognormal
+            A Lognormal that samples with exactly the mu and sigma given.
+        """
+        if np.ndim(mu) > 0:
+            mu = np.asarray(mu, dtype=np.float64)
+            sigma = np.asarray(sigma, dtype=np.float64)
+            s2 = sigma * sigma
+            mean = np.exp(mu + 0.5 * s2)
+            stdev = mean * np.sqrt(np.expm1(s2))
+        else:
+            s2 = sigma * sigma
+            mean = math.exp(mu + 0.5 * s2)
+            stdev = mean * math.sqrt(math.expm1(s2))
+
+        dist = cls(
+            mean, stdev, random_seed=random_seed, bit_generator=bit_generator
+        )
+
+        # use the parameters given rather than a round trip through mean
+        # and stdev.
+        dist.mu = mu
+        dist.sigma = sigma
+        return dist
+
     def normal_moments_from_lognormal(
-        self, m: float, v: float
-    ) -> Tuple[float, float]:
+        self, m: ArrayLike, v: ArrayLike
+    ) -> Tuple[Any, Any]:
         """
         Calculate mu and sigma of the normal distribution underlying
         a lognormal with mean m and variance v.
 
         Parameters
         ----------
-        m : float
+        m : ArrayLike
             Mean of lognormal distribution.
-        v : float
+        v : ArrayLike
             Variance of lognormal distribution.
 
         Returns
         -------
-        Tuple[float, float]
+        Tuple[Any, Any]
             The mu and sigma parameters of the underlying normal distribution.
+            Arrays are returned if m and v are arrays.
 
         Notes
         -----
@@ -76,10 +223,26 @@ class Lognormal:
         https://blogs.sas.com/content/iml/2014/06/04/simulate-lognormal-data-
         with-specified-mean-and-variance.html
         """
-        phi = math.sqrt(v + m**2)
-        mu = math.log(m**2 / phi)
-        sigma = math.sqrt(math.log(phi**2 / m**2))
-        return mu, sigma
+        # sigma^2 = log(1 + v / m^2) and mu = log(m) - sigma^2 / 2.
+        # log1p is accurate when v is small relative to m^2.
+        if np.ndim(m) > 0:
+            s2 = np.log1p(v / (m * m))
+            return np.log(m) - 0.5 * s2, np.sqrt(s2)
+
+        s2 = math.log1p(v / (m * m))
+        return math.log(m) - 0.5 * s2, math.sqrt(s2)
+
+    def _refill(self) -> None:
+        """
+        Fill the buffer of standard normal samples (numpy's Ziggurat
+        algorithm) with a single vectorised call.
+
+        The buffer holds z rather than lognormal samples: np.exp can differ
+        from math.exp (used by Generator.lognormal) in the last bit, so
+        the transform is applied to each value as it is used.
+        """
+        self._z = self.rng.standard_normal(size=self._bufsize).tolist()
+        self._zi = 0
 
     def sample(
         self, size: Optional[Union[int, Tuple[int, ...]]] = None
@@ -87,6 +250,9 @@ class Lognormal:
         """
         Generate random samples from the lognormal distribution.
 
+        Single samples are computed from a pre-generated buffer of standard
+        normal samples.
+
         Parameters
         ----------
         size : Optional[Union[int, Tuple[int, ...]]], default=None
@@ -101,16 +267,83 @@ class Lognormal:
             Random samples from the lognormal distribution:
             - A single float when size is None
             - A numpy array of floats with shape determined by size parameter
+            - For a batch created with from_arrays, the array has an extra
+              leading dimension of len(means)
         """
-        return self.rng.lognormal(self.mu, self.sigma, size=size)
+        if np.ndim(self.mu) > 0:
+            # batch: one call to numpy samples every distribution.
+            if size is None:
+                extra = ()
+            elif isinstance(size, (int, np.integer)):
+                extra = (int(size),)
+            else:
+                extra = tuple(size)
+
+            mu = self.mu.reshape(self.mu.shape + (1,) * len(extra))
+            sigma = self.sigma.reshape(mu.shape)
+            return self.rng.lognormal(mu, sigma, size=self.mu.shape + extra)
+
+        if size is not None:
+            return self.rng.lognormal(self.mu, self.sigma, size=size)
+
+        return self.sample_one()
+
+    def sample_one(self) -> float:
+        """
+        Generate a single sample from the lognormal distribution. The same
+        as sample() without checking size: use this in a simulation's hot
+        loop. Not available for a batch created with from_arrays.
+
+        Returns
+        -------
+        float
+            A single random sample.
+        """
+        # single sample: exp(mu + sigma * z) is the transform used by
+        # Generator.lognormal, so samples are identical for a given seed.
+        if self._zi == self._bufsize:
+            self._refill()
+        z = self._z[self._zi]
+        self._zi += 1
+        return math.exp(self.mu + self.sigma * z)
+
+    def sample_many(self, n: int) -> NDArray:
+        """
+        Generate an array of n samples in a single call to numpy. Use this
+        rather than repeated calls to sample() when many values are needed.
+
+        Parameters
+        ----------
+        n : int
+            The number of samples to return.
+
+        Returns
+        -------
+        NDArray
+            A 1-D array of n samples (for a Lognormal batch created with
+            from_arrays the shape is (len(means), n)).
+        """
+        return self.sample(size=n)
 
 class Exponential:
     """
     Convenience class for the exponential distribution.
-    packages up distribution parameters, seed and random generator.
+    Packages up distribution parameters, seed and random generator.
     """
 
-    def __init__(self, mean, random_seed=None):
+    __slots__ = (
+        "rand", "bit_generator", "mean", "method", "_bufsize", "_buf", "_idx",
+    )
+
+    def __init__(
+        self,
+        mean,
+        random_seed=None,
+        buffer_size=SAMPLE_BUFFER_SIZE,
+        method="zig",
+        bit_generator=BIT_GENERATOR,
+        rng=None,
+    ):
         """
         Constructor
 
@@ -120,27 +353,150 @@ class Exponential:
             The mean of the exponential distribution
 
         random_seed: int| SeedSequence, optional (default=None)
-            A random seed to reproduce samples.  If set to none then a unique
+            A random seed to reproduce samples. If set to none then a unique
             sample is created.
+
+        buffer_size: int, optional (default=SAMPLE_BUFFER_SIZE)
+            Number of single samples pre-generated in each call to numpy.
+
+        method: str, optional (default="zig")
+            "zig" uses numpy's Ziggurat algorithm. "inv" uses inversion of
+            uniform samples i.e. -mean * log(1 - u). Inversion is useful when
+            samples should move monotonically with the random numbers
+            (e.g. common random numbers).
+
+        bit_generator: numpy BitGenerator class, optional
+            (default=BIT_GENERATOR)
+            Used to create the random generator e.g. np.random.SFC64,
+            np.random.PCG64 or np.random.Philox.
+
+        rng: np.random.Generator, optional (default=None)
+            An existing random generator to sample from e.g. one shared
+            with other distributions of the same stream. If provided,
+            random_seed and bit_generator are ignored.
+        """
+        self.bit_generator = bit_generator
+        if rng is None:
+            rng = np.random.Generator(bit_generator(random_seed))
+        self.rand = rng
+        self.method = method
+
+        # buffer of pre-generated samples used when a single value is requested
+        # it is filled on first use so that array samples from a new
+        # distribution are the same as the equivalent single samples.
+        self._bufsize = buffer_size
+        self._buf = None
+        self._idx = self._bufsize
+
+        self.set_mean(mean)
+
+    def set_mean(self, mean):
         """
-        self.rand = np.random.default_rng(seed=random_seed)
+        Validate and store the mean of the distribution. Any buffered
+        samples taken with the previous mean are discarded.
+
+        Params:
+        ------
+        mean: float
+            The mean of the exponential distribution
+
+        Raises:
+        ------
+        ValueError
+            If mean is negative or NaN. Samples are scaled standard
+            exponentials so numpy does not check the mean itself.
+        """
+        if not mean >= 0:
+            raise ValueError(f"mean must be non-negative (got {mean})")
         self.mean = mean
+        self._idx = self._bufsize
+
+    def reseed(self, random_seed=None, rng=None):
+        """
+        Replace the random number generator with a new seed. Any buffered
+        samples from the previous generator are discarded.
+
+        Params:
+        ------
+        random_seed: int | SeedSequence
+            Used with params to create a series of repeatable samples.
+
+        rng: np.random.Generator, optional (default=None)
+            An existing random generator to use instead of a new one.
+        """
+        if rng is None:
+            rng = np.random.Generator(self.bit_generator(random_seed))
+        self.rand = rng
+        self._idx = self._bufsize
+
+    def _refill(self):
+        """
+        Fill the sample buffer with a single vectorised call to numpy.
+        Samples are stored as python floats so that arithmetic on a single
+        sample does not go through numpy scalar operations.
+        """
+        self._buf = (
+            self.mean
+            * self.rand.standard_exponential(
+                size=self._bufsize, method=self.method
+            )
+        ).tolist()
+        self._idx = 0
 
     def sample(self, size=None):
         """
         Generate a sample from the exponential distribution
 
+        Single samples are taken from a pre-generated buffer. This avoids the
+        overhead of calling numpy for every event in the simulation.
+
         Params:
         -------
         size: int, optional (default=None)
-            the number of samples to return.  If size=None then a single
+            the number of samples to return. If size=None then a single
             sample is returned.
 
         Returns:
         -------
         float or np.ndarray (if size >=1)
         """
-        return self.rand.exponential(self.mean, size=size)
+        if size is not None:
+            return self.mean * self.rand.standard_exponential(
+                size=size, method=self.method
+            )
+
+        return self.sample_one()
+
+    def sample_one(self):
+        """
+        Generate a single sample from the pre-generated buffer. The same as
+        sample() without checking size: use this in a simulation's hot loop.
+
+        Returns:
+        -------
+        float
+        """
+        if self._idx == self._bufsize:
+            self._refill()
+        value = self._buf[self._idx]
+        self._idx += 1
+        return value
+
+    def sample_many(self, n):
+        """
+        Generate an array of n samples in a single call to numpy. Use this
+        rather than repeated calls to sample() when many values are needed.
+
+        Params:
+        -------
+        n: int
+            the number of samples to return.
+
+        Returns:
+        -------
+        np.ndarray
+        """
+        return self.sample(size=n)
 
 
 class Bernoulli:
@@ -154,7 +510,16 @@ class Bernoulli:
     Use the Bernoulli distribution to sample success or failure.
     """
 
-    def __init__(self, p, random_seed=None):
+    __slots__ = ("rand", "p", "_bufsize", "_buf", "_idx")
+
+    def __init__(
+        self,
+        p,
+        random_seed=None,
+        buffer_size=SAMPLE_BUFFER_SIZE,
+        bit_generator=BIT_GENERATOR,
+        rng=None,
+    ):
         """
         Constructor
 
@@ -166,13 +531,182 @@ class Bernoulli:
         random_seed: int | SeedSequence, optional (default=None)
             A random seed to reproduce samples.  If set to none then a unique
             sample is created.
+
+        buffer_size: int, optional (default=SAMPLE_BUFFER_SIZE)
+            Number of single samples pre-generated in each call to numpy.
+
+        bit_generator: numpy BitGenerator class, optional
+            (default=BIT_GENERATOR)
+            Used to create the random generator.
+
+        rng: np.random.Generator, optional (default=None)
+            An existing random generator to sample from. If provided,
+            random_seed and bit_generator are ignored.
+
+        Raises:
+        ------
+        ValueError
+            If p is not in [0, 1] or is NaN.
         """
-        self.rand = np.random.default_rng(seed=random_seed)
+        if not 0.0 <= p <= 1.0:
+            raise ValueError(f"p must be in [0, 1] (got {p})")
+        if rng is None:
+            rng = np.random.Generator(bit_generator(random_seed))
+        self.rand = rng
         self.p = p
 
+        # buffer of pre-generated samples used when a single value is
+        # requested. Filled on first use.
+        self._bufsize = buffer_size
+        self._buf = None
+        self._idx = self._bufsize
+
+    def _bernoulli(self, size):
+        """
+        Sample size values by comparing uniforms to p. This is several
+        times faster than rand.binomial(n=1, ...) and follows the same
+        inversion approach (flipping the comparison when p > 0.5), but the
+        streams are not guaranteed to be identical: numpy compares against
+        exp(log(1 - p)) and draws no uniform when p == 0.
+
+        Outcomes are stored as uint8 (1 byte) rather than int64 (8 bytes).
+        """
+        u = self.rand.random(size)
+        if self.p > 0.5:
+            successes = u <= self.p
+        else:
+            successes = u > 1.0 - self.p
+        return successes.view(np.uint8)
+
+    def _refill(self):
+        """
+        Fill the sample buffer with a single vectorised call to numpy.
+        """
+        self._buf = self._bernoulli(self._bufsize).tolist()
+        self._idx = 0
+
     def sample(self, size=None):
         """
-        Generate a sample from the exponential distribution
+        Generate a sample from the Bernoulli distribution
+
+        Single samples are taken from a pre-generated buffer.
+
+        Params:
+        -------
+        size: int, optional (default=None)
+            the number of samples to return.  If size=None then a single
+            sample is returned.
+
+        Returns:
+        -------
+        int or np.ndarray of uint8 (if size >=1)
+        """
+        if size is not None:
+            return self._bernoulli(size)
+
+        return self.sample_one()
+
+    def sample_one(self):
+        """
+        Generate a single sample from the pre-generated buffer. The same as
+        sample() without checking size: use this in a simulation's hot loop.
+
+        Returns:
+        -------
+        int
+        """
+        if self._idx == self._bufsize:
+            self._refill()
+        value = self._buf[self._idx]
+        self._idx += 1
+        return value
+
+    def sample_many(self, n):
+        """
+        Generate an array of n samples in a single call to numpy. Use this
+        rather than repeated calls to sample() when many values are needed.
+
+        Params:
+        -------
+        n: int
+            the number of samples to return.
+
+        Returns:
+        -------
+        np.ndarray
+        """
+        return self.sample(size=n)
+
+
+class Uniform:
+    """
+    Convenience class for the Uniform distribution.
+    packages up distribution parameters, seed and random generator.
+    """
+
+    __slots__ = ("rand", "low", "high", "_bufsize", "_buf", "_idx")
+
+    def __init__(
+        self,
+        low,
+        high,
+        random_seed=None,
+        buffer_size=SAMPLE_BUFFER_SIZE,
+        bit_generator=BIT_GENERATOR,
+        rng=None,
+    ):
+        """
+        Constructor
+
+        Params:
+        ------
+        low: float
+            lower range of the uniform
+
+        high: float
+            upper range of the uniform
+
+        random_seed: int | SeedSequence, optional (default=None)
+            A random seed to reproduce samples.  If set to none then a unique
+            sample is created.
+
+        buffer_size: int, optional (default=SAMPLE_BUFFER_SIZE)
+            Number of single samples pre-generated in each call to numpy.
+
+        bit_generator: numpy BitGenerator class, optional
+            (default=BIT_GENERATOR)
+            Used to create the random generator.
+
+        rng: np.random.Generator, optional (default=None)
+            An existing random generator to sample from. If provided,
+            random_seed and bit_generator are ignored.
+        """
+        if rng is None:
+            rng = np.random.Generator(bit_generator(random_seed))
+        self.rand = rng
+        self.low = low
+        self.high = high
+
+        # buffer of pre-generated U(0, 1) samples used when a single value
+        # is requested. Filled on first use. These are transformed to
+        # low + (high - low) * u when sampled so that the buffer is still
+        # valid if low or high are changed.
+        self._bufsize = buffer_size
+        self._buf = None
+        self._idx = self._bufsize
+
+    def _refill(self):
+        """
+        Fill the U(0, 1) sample buffer with a single vectorised call to numpy.
+        """
+        self._buf = self.rand.random(size=self._bufsize).tolist()
+        self._idx = 0
+
+    def sample(self, size=None):
+        """
+        Generate a sample from the uniform distribution
+
+        Single samples are taken from a pre-generated buffer.
 
         Params:
         -------
@@ -184,7 +718,42 @@ class Bernoulli:
         -------
         float or np.ndarray (if size >=1)
         """
-        return self.rand.binomial(n=1, p=self.p, size=size)
+        if size is not None:
+            return self.rand.uniform(low=self.low, high=self.high, size=size)
+
+        return self.sample_one()
+
+    def sample_one(self):
+        """
+        Generate a single sample from the pre-generated buffer. The same as
+        sample() without checking size: use this in a simulation's hot loop.
+
+        Returns:
+        -------
+        float
+        """
+        if self._idx == self._bufsize:
+            self._refill()
+        u = self._buf[self._idx]
+        self._idx += 1
+        return self.low + (self.high - self.low) * u
+
+    def sample_many(self, n):
+        """
+        Generate an array of n samples in a single call to numpy. Use this
+        rather than repeated calls to sample() when many values are needed.
+
+        Params:
+        -------
+        n: int
+            the number of samples to return.
+
+        Returns:
+        -------
+        np.ndarray
+        """
+        return self.sample(size=n)
+
 
 class DiscreteEmpirical:
     """
@@ -202,11 +771,15 @@ class DiscreteEmpirical:
     4. Initial conditions - no. entities in a queue.
     """
 
+    __slots__ = ("values", "freq", "rng", "probabilities", "_cdf")
+
     def __init__(
         self,
         values: ArrayLike,
         freq: ArrayLike,
         random_seed: Optional[Union[int, SeedSequence]] = None,
+        bit_generator: Any = BIT_GENERATOR,
+        rng: Optional[np.random.Generator] = None,
     ):
         """
         Initialize a discrete distribution.
@@ -224,6 +797,13 @@ class DiscreteEmpirical:
             A random seed or SeedSequence to reproduce samples. If None, a
             unique sample sequence is generated.
 
+        bit_generator : Any, default=BIT_GENERATOR
+            numpy BitGenerator class used to create the random generator.
+
+        rng : Optional[np.random.Generator], default=None
+            An existing random generator to sample from. If provided,
+            random_seed and bit_generator are ignored.
+
         Raises
         ------
         TypeError
@@ -241,9 +821,16 @@ class DiscreteEmpirical:
                 "values and freq arguments must be of equal length"
             )
 
-        self.rng = np.random.default_rng(random_seed)
+        if rng is None:
+            rng = np.random.Generator(bit_generator(random_seed))
+        self.rng = rng
         self.probabilities = self.freq / self.freq.sum()
 
+        # cumulative probabilities used to sample by inversion. Normalised
+        # so the final value is exactly 1.0 (guards against rounding drift).
+        self._cdf = np.cumsum(self.probabilities)
+        self._cdf /= self._cdf[-1]
+
     def __repr__(self):
         values_repr = (
             str(self.values.tolist())
@@ -279,12 +866,45 @@ class DiscreteEmpirical:
               size is None
             - A numpy array of values with shape determined by size parameter
         """
-        sample = self.rng.choice(self.values, p=self.probabilities, size=size)
+        # equivalent to rng.choice(values, p=probabilities) without
+        # recalculating the cumulative probabilities on every call.
+        u = self.rng.random(size)
+        sample = self.values[np.searchsorted(self._cdf, u, side="right")]
 
         if size is None:
             return sample.item()
         return sample
 
+    def sample_one(self) -> Any:
+        """
+        Generate a single sample from the discrete distribution. The same
+        as sample() without checking size.
+
+        Returns
+        -------
+        Any
+            A single value (of whatever type was in the values array).
+        """
+        u = self.rng.random()
+        return self.values[np.searchsorted(self._cdf, u, side="right")].item()
+
+    def sample_many(self, n: int) -> NDArray:
+        """
+        Generate an array of n samples in a single call to numpy. Use this
+        rather than repeated calls to sample() when many values are needed.
+
+        Parameters
+        ----------
+        n : int
+            The number of samples to return.
+
+        Returns
+        -------
+        NDArray
+            A 1-D array of n samples.
+        """
+        return self.sample(size=n)
+
 class FixedDistribution:
     """
     Fixed distribution implementation.
@@ -296,6 +916,8 @@ class FixedDistribution:
     sample a constant value regardless of the number of samples requested.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: float):
         """
         Initialize a fixed distribution.
@@ -311,7 +933,9 @@ class FixedDistribution:
         return f"FixedDistribution(value={self.value})"
 
     def sample(
-        self, size: Optional[Union[int, Tuple[int, ...]]] = None
+        self,
+        size: Optional[Union[int, Tuple[int, ...]]] = None,
+        writable: bool = False,
     ) -> Union[float, NDArray[np.float64]]:
         """
         Generate "samples" from the fixed distribution (always the same value).
@@ -325,6 +949,11 @@ class FixedDistribution:
             - If tuple of ints: returns an array with that shape filled with
               the fixed value
 
+        writable : bool, default=False
+            If False, the array returned is a read-only broadcast view of the
+            fixed value and no memory is allocated for the samples. Set to
+            True if the returned array will be modified.
+
         Returns
         -------
         Union[float, NDArray[np.float64]]
@@ -333,50 +962,37 @@ class FixedDistribution:
             - A numpy array filled with the fixed value with shape
               determined by size parameter
         """
-        if size is not None:
-            return np.full(size, self.value)
-        return self.value
-
-class Bernoulli:
-    """
-    Convenience class for the Bernoulli distribution.
-    packages up distribution parameters, seed and random generator.
-
-    The Bernoulli distribution is a special case of the binomial distribution
-    where a single trial is conducted
+        if size is None:
+            return self.value
 
-    Use the Bernoulli distribution to sample success or failure.
-    """
+        samples = np.broadcast_to(np.asarray(self.value), size)
+        return samples.copy() if writable else samples
 
-    def __init__(self, p, random_seed=None):
+    def sample_one(self) -> float:
         """
-        Constructor
+        Return the fixed value. Provided so that all distributions share
+        the same interface.
 
-        Params:
-        ------
-        p: float
-            probability of drawing a 1
-
-        random_seed: int | SeedSequence, optional (default=None)
-            A random seed to reproduce samples.  If set to none then a unique
-            sample is created.
+        Returns
+        -------
+        float
+            The fixed value.
         """
-        self.rand = np.random.default_rng(seed=random_seed)
-        self.p = p
+        return self.value
 
-    def sample(self, size=None):
+    def sample_many(self, n: int) -> NDArray:
         """
-        Generate a sample from the exponential distribution
+        Generate a read-only array of n copies of the fixed value. Provided
+        so that all distributions share the same interface.
 
-        Params:
-        -------
-        size: int, optional (default=None)
-            the number of samples to return.  If size=None then a single
-            sample is returned.
+        Parameters
+        ----------
+        n : int
+            The number of samples to return.
 
-        Returns:
+        Returns
         -------
-        float or np.ndarray (if size >=1)
+        NDArray
+            A 1-D array of n samples.
         """
-        return self.rand.binomial(n=1, p=self.p, size=size)
-
+        return self.sample(size=n)
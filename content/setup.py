@@ -0,0 +1,23 @@
+"""
+Optional ahead-of-time compilation of basic_model.py with Cython.
+
+The notebooks do not require this. To build a compiled version of the
+model in this directory run:
+
+    python setup.py build_ext --inplace
+
+Python imports the compiled extension in preference to basic_model.py.
+Delete the generated basic_model.*.so (or .pyd) file to return to the
+pure Python version.
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="basic_model",
+    ext_modules=cythonize(
+        ["basic_model.py"],
+        compiler_directives={"language_level": 3},
+    ),
+)
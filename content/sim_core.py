@@ -0,0 +1,250 @@
+"""
+Compiled Call Centre Simulation Core
+
+An event driven implementation of the call centre model in basic_model.py
+that avoids SimPy's event queue and generator machinery. When numba is
+installed the simulation loop is JIT compiled.
+
+The model has a single pool of identical operators, FIFO queuing and no
+preemption. The only events are therefore call arrivals and service ends.
+Service end events are held in a binary min-heap of the times each operator
+next becomes free.
+
+numba is an optional dependency and is not available in the browser
+(JupyterLite). Use NUMBA_AVAILABLE to check before relying on compilation.
+
+Author: Tom Monks
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """
+        Stand in for numba.njit when numba is not installed. Returns the
+        function unchanged so that the module still runs as pure Python.
+        """
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _sift_down(heap, pos):
+    """
+    Restore the min-heap property after heap[pos] has been increased.
+
+    Params:
+    -------
+    heap: np.ndarray
+        Array based binary min-heap.
+
+    pos: int
+        Index of the value that has been updated.
+    """
+    n = heap.shape[0]
+    value = heap[pos]
+    while True:
+        child = 2 * pos + 1
+        if child >= n:
+            break
+        if child + 1 < n and heap[child + 1] < heap[child]:
+            child += 1
+        if heap[child] >= value:
+            break
+        heap[pos] = heap[child]
+        pos = child
+    heap[pos] = value
+
+
+@njit(cache=True)
+def simulate_presampled(arrival_times, call_durations, n_operators, rc_period):
+    """
+    Simulate the call centre from pre-sampled arrival times and call
+    durations.
+
+    With FIFO queuing and identical operators each call is answered at
+    the later of its arrival time and the time the first operator becomes
+    free. The i'th call answered is therefore the i'th call to arrive and
+    uses the i'th call duration.
+
+    Params:
+    -------
+    arrival_times: np.ndarray
+        Ascending arrival times of calls within the run length.
+
+    call_durations: np.ndarray
+        Call durations. Must be at least as long as arrival_times.
+
+    n_operators: int
+        Number of call operators
+
+    rc_period: float
+        Results collection period - how long to run the simulation
+
+    Returns:
+    --------
+    tuple: (np.ndarray of waiting times of answered calls,
+            total duration of calls completed within the run length)
+    """
+    waiting_times, total_call_duration, _ = simulate_tile(
+        arrival_times, call_durations, np.zeros(n_operators), rc_period
+    )
+    return waiting_times, total_call_duration
+
+
+@njit(cache=True)
+def simulate_tile(arrival_times, call_durations, free_at, rc_period):
+    """
+    Simulate one block (tile) of pre-sampled calls. The time each operator
+    is next free is carried between tiles in free_at so that a run can be
+    simulated from a sequence of tiles.
+
+    Params:
+    -------
+    arrival_times: np.ndarray
+        Ascending arrival times of the calls in the tile.
+
+    call_durations: np.ndarray
+        Call durations. Must be at least as long as arrival_times.
+
+    free_at: np.ndarray
+        Heap of the times each operator is next free. Updated in place.
+        Use np.zeros(n_operators) for the first tile.
+
+    rc_period: float
+        Results collection period - how long to run the simulation
+
+    Returns:
+    --------
+    tuple: (np.ndarray of waiting times of calls answered,
+            total duration of calls completed within the run length,
+            True if no later call can be answered within the run length)
+    """
+    # the event loop only resolves contention for operators: the time
+    # each call is answered. Results are calculated from the arrays after.
+    starts = np.empty(arrival_times.shape[0])
+
+    n_answered = 0
+    finished = False
+
+    for i in range(arrival_times.shape[0]):
+        start = max(arrival_times[i], free_at[0])
+        if start >= rc_period:
+            # FIFO: no later call can be answered within the run either.
+            finished = True
+            break
+
+        starts[n_answered] = start
+        n_answered += 1
+
+        free_at[0] = start + call_durations[i]
+        _sift_down(free_at, 0)
+
+    starts = starts[:n_answered]
+    durations = call_durations[:n_answered]
+    waiting_times = starts - arrival_times[:n_answered]
+    total_call_duration = durations[starts + durations < rc_period].sum()
+
+    return waiting_times, total_call_duration, finished
+
+
+@njit(cache=True)
+def triangular_icdf(u, low, mode, high):
+    """
+    Transform U(0, 1) samples to triangular samples by inversion.
+
+    This is the same transform used by numpy's Generator.triangular, so
+    given the same uniforms the samples are identical.
+
+    Params:
+    -------
+    u: np.ndarray
+        Samples from U(0, 1)
+
+    low: float
+        The smallest values that can be sampled
+
+    mode: float
+        The most frequently sample value
+
+    high: float
+        The highest value that can be sampled
+
+    Returns:
+    --------
+    np.ndarray: triangular samples of the same shape as u
+    """
+    base = high - low
+    ratio = (mode - low) / base
+    left_prod = (mode - low) * base
+    right_prod = (high - mode) * base
+
+    samples = np.empty_like(u)
+    for i in range(u.shape[0]):
+        if u[i] <= ratio:
+            samples[i] = low + math.sqrt(u[i] * left_prod)
+        else:
+            samples[i] = high - math.sqrt((1.0 - u[i]) * right_prod)
+    return samples
+
+
+@njit(cache=True)
+def preroll(u_arrivals, u_calls, mean_iat, low, mode, high):
+    """
+    Transform U(0, 1) samples into inter-arrival times (exponential) and
+    call durations (triangular) by inversion in a single pass.
+
+    The uniforms are drawn by the caller from separate random number
+    streams, so results are reproducible.
+
+    Params:
+    -------
+    u_arrivals: np.ndarray
+        Samples from U(0, 1) used for inter-arrival times
+
+    u_calls: np.ndarray
+        Samples from U(0, 1) used for call durations. Same length as
+        u_arrivals.
+
+    mean_iat: float
+        Mean inter-arrival time of calls (exponential)
+
+    low: float
+        Smallest call duration (triangular)
+
+    mode: float
+        Most frequent call duration (triangular)
+
+    high: float
+        Largest call duration (triangular)
+
+    Returns:
+    --------
+    tuple: (np.ndarray of inter-arrival times, np.ndarray of call durations)
+    """
+    base = high - low
+    ratio = (mode - low) / base
+    left_prod = (mode - low) * base
+    right_prod = (high - mode) * base
+
+    n = u_arrivals.shape[0]
+    inter_arrival_times = np.empty(n)
+    call_durations = np.empty(n)
+    for i in range(n):
+        inter_arrival_times[i] = -mean_iat * math.log1p(-u_arrivals[i])
+
+        u = u_calls[i]
+        if u <= ratio:
+            call_durations[i] = low + math.sqrt(u * left_prod)
+        else:
+            call_durations[i] = high - math.sqrt((1.0 - u) * right_prod)
+    return inter_arrival_times, call_durations